@@ -18,11 +18,16 @@ setup(
     name='slivka-client',
     version=get_version('slivka_client/__init__.py'),
     packages=['slivka_client'],
+    python_requires='>=3.7',
     install_requires=[
-        'attrs>=19.0',
+        'attrs>=19.3',
         'click>=7.1.2',
-        'requests>=2.13.0'
+        'requests>=2.18'
     ],
+    extras_require={
+        'orjson': ['orjson>=3.0'],
+        'toolbelt': ['requests-toolbelt>=0.9']
+    },
     entry_points={
         'console_scripts': [
             "slivka-cli = slivka_client.__main__:main"
@@ -1,7 +1,37 @@
-from .client import SlivkaClient
-from .file import File
-from .service import Service
-from .job import Job
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import SlivkaClient
+    from .file import File
+    from .service import Service
+    from .job import Job
 
 __all__ = ('SlivkaClient', 'File', 'Service', 'Job')
 __version__ = '1.2.1b1'
+
+# Public classes are imported on first access, so that importing the
+# package (e.g. to run the command line interface) does not load
+# requests until it is actually needed.
+_lazy_imports = {
+    'SlivkaClient': '.client',
+    'File': '.file',
+    'Service': '.service',
+    'Job': '.job',
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _lazy_imports[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_lazy_imports})
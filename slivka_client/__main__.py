@@ -1,12 +1,16 @@
 import collections
+import contextlib
 import os
 import textwrap
+from typing import TYPE_CHECKING
 
-import attr
 import click
 
-from slivka_client import Service
-from .client import SlivkaClient
+# the client (and requests with it) is imported only when a command runs
+if TYPE_CHECKING:
+    from .client import SlivkaClient
+
+_DOWNLOAD_WORKERS = 4
 
 
 @click.group()
@@ -15,45 +19,47 @@ from .client import SlivkaClient
               default="https://www.compbio.dundee.ac.uk/slivka/")
 @click.pass_context
 def main(ctx: click.Context, host):
-    obj = ctx.ensure_object(dict)
-    obj['client'] = SlivkaClient(host)
+    from .client import SlivkaClient
+    # a single client is shared by the invoked subcommand
+    ctx.obj = client = SlivkaClient(host)
+    ctx.call_on_close(client.close)
 
 
 @main.command()
 @click.option("--name", help="Show one service by name.", metavar="NAME")
 @click.option("--terse", is_flag=True, help="Short output.")
 @click.pass_obj
-def services(obj, name, terse):
-    client: SlivkaClient = obj['client']
+def services(client: 'SlivkaClient', name, terse):
     if name:
-        service = client.get_service(name)
-        _print_service(service, terse)
+        services = [client.get_service(name)]
     else:
-        for service in client.services:
-            _print_service(service, terse)
+        services = client.services
+    # output is written at once rather than line by line
+    if services:
+        click.echo('\n'.join(_format_service(s, terse) for s in services))
 
 
-def _print_service(service, terse=False):
+def _format_service(service, terse=False):
     if terse:
-        click.echo(service.name)
-    else:
-        click.echo(f"{service.id}: {service.name}")
-        click.echo("classifiers:")
-        text = textwrap.indent('\n'.join(service.classifiers), ' - ')
-        click.echo(text)
-        click.echo("fields:")
-        lines = []
-        for param in service.parameters:
-            attrs = attr.asdict(param, filter=lambda _, val: val is not None,
-                                dict_factory=collections.OrderedDict)
-            line = f"{attrs.pop('name')}: {attrs.pop('type')}; "
-            line += ", ".join(
-                f"{key.replace('_', '-')}={val}"
-                for key, val in attrs.items()
-            )
-            lines.append(line)
-        text = textwrap.indent('\n'.join(lines), ' - ')
-        click.echo(text)
+        return service.name
+    import attr
+    lines = []
+    for param in service.parameters:
+        attrs = attr.asdict(param, filter=lambda _, val: val is not None,
+                            dict_factory=collections.OrderedDict)
+        line = f"{attrs.pop('name')}: {attrs.pop('type')}; "
+        line += ", ".join(
+            f"{key.replace('_', '-')}={val}"
+            for key, val in attrs.items()
+        )
+        lines.append(line)
+    return '\n'.join([
+        f"{service.id}: {service.name}",
+        "classifiers:",
+        textwrap.indent('\n'.join(service.classifiers), ' - '),
+        "fields:",
+        textwrap.indent('\n'.join(lines), ' - ')
+    ])
 
 
 @main.command()
@@ -61,18 +67,18 @@ def _print_service(service, terse=False):
 @click.argument("service")
 @click.argument("values", nargs=-1, metavar="KEY=VALUE...")
 @click.pass_obj
-def submit(obj, service, values, terse):
-    client: SlivkaClient = obj['client']
-    service: Service = client.get_service(service)
+def submit(client: 'SlivkaClient', service, values, terse):
+    service = client.get_service(service)
     data = []
     files = []
-    for arg in values:
-        k, v = arg.split('=', 1)
-        if v.startswith('@'):
-            files.append((k, open(v[1:], 'rb')))
-        else:
-            data.append((k, v))
-    jid = service.submit_job(data, files)
+    with contextlib.ExitStack() as stack:
+        for arg in values:
+            k, v = arg.split('=', 1)
+            if v.startswith('@'):
+                files.append((k, stack.enter_context(open(v[1:], 'rb'))))
+            else:
+                data.append((k, v))
+        jid = service.submit_job(data, files)
     if terse:
         click.echo(jid)
     else:
@@ -81,15 +87,14 @@ def submit(obj, service, values, terse):
 
 @main.command()
 @click.option("--terse", is_flag=True, help="Short output.")
-@click.argument("job-id")
+@click.argument("job-ids", nargs=-1, required=True, metavar="JOB-ID...")
 @click.pass_obj
-def status(obj, job_id, terse):
-    client: SlivkaClient = obj['client']
-    job = client.get_job(job_id)
-    if terse:
-        click.echo(job.status)
-    else:
-        click.echo(f"The job status is: {job.status}")
+def status(client: 'SlivkaClient', job_ids, terse):
+    for job in client.get_jobs(job_ids):
+        if terse:
+            click.echo(job.status)
+        else:
+            click.echo(f"The job {job.id} status is: {job.status}")
 
 
 @main.command()
@@ -100,28 +105,46 @@ def status(obj, job_id, terse):
 @click.option("--overwrite", default="prompt", show_default=True,
               type=click.Choice(["yes", "no", "prompt"], case_sensitive=False),
               help="Set overwriting behaviour for existing files.")
+@click.option("--resume", is_flag=True,
+              help="Resume downloading partially downloaded files.")
 @click.argument("job-id")
 @click.pass_obj
-def files(obj, job_id, download, directory, overwrite):
-    client: SlivkaClient = obj['client']
+def files(client: 'SlivkaClient', job_id, download, directory, overwrite,
+          resume):
+    from concurrent.futures import ThreadPoolExecutor
     job = client.get_job(job_id)
-    for file in job.files:
+    job_files = job.files
+    if download:
+        os.makedirs(directory, exist_ok=True)
+    created_dirs = {directory}
+    downloads = []
+    for file in job_files:
         click.echo(f"{file.id}: {file.label}; "
                    f"content-type={file.media_type}")
         if download:
-            if not os.path.exists(directory):
-                os.makedirs(directory)
             fp = os.path.join(directory, file.path)
-            if os.path.dirname(file.path):
-                os.makedirs(os.path.dirname(fp), exist_ok=True)
+            file_dir = os.path.dirname(fp)
+            if file_dir not in created_dirs:
+                os.makedirs(file_dir, exist_ok=True)
+                created_dirs.add(file_dir)
             if os.path.exists(fp):
                 if overwrite == "prompt":
-                    if not click.confirm(f"File {fp} exists. Overwrite?"):
+                    action = "Resume" if resume else "Overwrite"
+                    if not click.confirm(f"File {fp} exists. {action}?"):
                         click.echo("Skipping.")
                         continue
                 elif overwrite == "no":
                     click.echo(f"File {fp} exists. Skipping.")
-            file.dump(fp)
+                    continue
+            downloads.append((file, fp))
+    # prompts are answered first, then the files are fetched concurrently
+    with ThreadPoolExecutor(_DOWNLOAD_WORKERS) as executor:
+        futures = [
+            executor.submit(file.dump, fp, resume=resume)
+            for file, fp in downloads
+        ]
+        for future in futures:
+            future.result()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,75 @@
+import functools
+from urllib.parse import urljoin, urlsplit
+
+import requests
+from requests.utils import guess_filename, to_key_val_list
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+
+shared_session = requests.Session()
+"""Session used by the objects that were not created by a client."""
+
+
+def read_json(response: requests.Response):
+    """Decode the JSON body of the response.
+
+    Uses orjson if it is installed and falls back to the standard
+    library json module otherwise.
+    """
+    return _json_loads(response.content)
+
+
+def form_request_args(data=None, files=None) -> dict:
+    """Build keyword arguments of a request posting *data* and *files*.
+
+    If requests-toolbelt is installed, multipart bodies are streamed
+    from the files instead of being assembled in memory by requests.
+    Values are encoded the same way requests encodes them.
+    """
+    if not files or MultipartEncoder is None:
+        return {'data': data, 'files': files}
+    fields = []
+    for key, values in to_key_val_list(data or {}):
+        if isinstance(values, (str, bytes)) or not hasattr(values, '__iter__'):
+            values = [values]
+        for value in values:
+            if value is None:
+                continue
+            if not isinstance(value, bytes):
+                value = str(value)
+            fields.append((key, value))
+    for key, value in to_key_val_list(files):
+        if not isinstance(value, (tuple, list)):
+            value = (guess_filename(value) or key, value)
+        if value[1] is None:
+            # requests leaves out the files which are not set
+            continue
+        fields.append((key, tuple(value)))
+    encoder = MultipartEncoder(fields)
+    return {'data': encoder, 'headers': {'Content-Type': encoder.content_type}}
+
+
+@functools.lru_cache(maxsize=64)
+def _url_origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def join_url(base: str, path: str) -> str:
+    """Resolve a resource *path* from a server response against *base*.
+
+    The server returns absolute paths, which only need the scheme and
+    host of the base prepended. Anything else goes through ``urljoin``.
+    """
+    if path.startswith('/') and not path.startswith('//'):
+        return _url_origin(base) + path
+    return urljoin(base, path)
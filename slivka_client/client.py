@@ -2,17 +2,23 @@ import io
 import os
 import re
 from collections import namedtuple
-from typing import Union, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union, List, Iterable
 from urllib.parse import urljoin, urlsplit
 
 import requests
 
+from ._http import read_json, form_request_args
 from .file import File
 from .job import Job
 from .service import Service
 
 Version = namedtuple('Version', ['client', 'server', 'API'])
 
+_SCHEME_RE = re.compile(r'(\w+:)?//')
+
+_MAX_WORKERS = 8
+
 
 class SlivkaClient:
     """
@@ -25,10 +31,15 @@ class SlivkaClient:
     """
 
     def __init__(self, url: str):
-        if not re.match(r'(\w+:)?//', url):
+        if not _SCHEME_RE.match(url):
             url = 'http://' + url
         self._url = urlsplit(url, scheme='http').geturl()
+        # resolving relative paths against the base is plain concatenation
+        self._base_url = urljoin(self._url, '.')
         self._services = None
+        self._services_index = {}
+        self._services_etag = None
+        self._session = requests.Session()
 
     def get_url(self) -> str:
         """Get the URL the client will connect to.
@@ -39,11 +50,14 @@ class SlivkaClient:
 
     url = property(get_url)
 
+    def _build_url(self, path: str) -> str:
+        return self._base_url + path
+
     def get_version(self) -> Version:
         from . import __version__
-        response = requests.get(urljoin(self.url, 'api/version'))
+        response = self._session.get(self._build_url('api/version'))
         response.raise_for_status()
-        resp_json = response.json()
+        resp_json = read_json(response)
         return Version(
             client=__version__,
             server=resp_json['slivkaVersion'],
@@ -64,21 +78,30 @@ class SlivkaClient:
     services = property(get_services)
 
     def get_service(self, name):
-        try:
-            return next(s for s in self.services if s.id == name)
-        except StopIteration:
-            raise KeyError(name)
+        if self._services is None:
+            self.reload_services()
+        return self._services_index[name]
 
     __getitem__ = get_service
 
     def reload_services(self):
         """Force reloading the services list from the server."""
-        response = requests.get(urljoin(self.url, 'api/services'))
+        headers = {}
+        if self._services_etag is not None:
+            headers['If-None-Match'] = self._services_etag
+        response = self._session.get(
+            self._build_url('api/services'), headers=headers
+        )
+        if response.status_code == 304:
+            # the list has not changed since the last reload
+            return
         response.raise_for_status()
         self._services = [
-            Service.from_response(self.url, service)
-            for service in response.json()['services']
+            Service.from_response(self.url, service, self._session)
+            for service in read_json(response)['services']
         ]
+        self._services_index = {s.id: s for s in self._services}
+        self._services_etag = response.headers.get('ETag')
 
     def upload_file(self,
                     file: Union[str, io.BufferedIOBase],
@@ -93,13 +116,16 @@ class SlivkaClient:
         :rtype: slivka_client.File
         """
         if isinstance(file, (str, bytes, os.PathLike)):
-            file = open(file, 'rb')
-        response = requests.post(
-            url=urljoin(self.url, 'api/files'),
-            files={'file': (title, file)}
+            with open(file, 'rb') as fp:
+                return self.upload_file(fp, title)
+        response = self._session.post(
+            url=self._build_url('api/files'),
+            **form_request_args(files={'file': (title, file)})
         )
         response.raise_for_status()
-        return File.from_response(self.url, response.json())
+        return File.from_response(
+            self.url, read_json(response), self._session
+        )
 
     def get_file(self, file_id: str) -> File:
         """Create a file handler from file id."""
@@ -108,15 +134,39 @@ class SlivkaClient:
             path = f"api/jobs/{parts[0]}/files/{parts[1]}"
         else:
             path = f"api/files/{parts[0]}"
-        response = requests.get(urljoin(self.url, path))
+        response = self._session.get(self._build_url(path))
         response.raise_for_status()
-        return File.from_response(self.url, response.json())
+        return File.from_response(
+            self.url, read_json(response), self._session
+        )
 
     def get_job(self, job_id: str) -> Job:
         """Create a job handler from job id """
-        response = requests.get(urljoin(self.url, f"api/jobs/{job_id}"))
+        response = self._session.get(self._build_url(f"api/jobs/{job_id}"))
         response.raise_for_status()
-        return Job.from_response(self.url, response.json())
+        return Job.from_response(
+            self.url, read_json(response), self._session,
+            etag=response.headers.get('ETag')
+        )
+
+    def get_jobs(self, job_ids: Iterable[str]) -> List[Job]:
+        """Create job handlers for multiple job ids.
+
+        The server has no endpoint returning many jobs at once, so
+        the jobs are requested concurrently over the client session.
+        """
+        with ThreadPoolExecutor(_MAX_WORKERS) as executor:
+            return list(executor.map(self.get_job, job_ids))
+
+    def close(self):
+        """Close the connections opened by the client."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     def __repr__(self):
         return 'SlivkaClient(%s)' % self._url
@@ -1,18 +1,32 @@
 import io
 import os
-from urllib.parse import urljoin
+import re
 
 import attr
 import requests
 
+from ._http import join_url, shared_session
 
-@attr.s()
-class File(str):
-    def __new__(cls, *args, **kwargs):
-        # grab id from the third position or 'id' kwarg
-        val = args[2] if len(args) >= 3 else kwargs['id']
-        return super().__new__(cls, val)
+_CHUNK_SIZE = 64 * 1024
+_CONTENT_RANGE_RE = re.compile(r'bytes (?:(\d+)-\d+|\*)/(\d+|\*)')
 
+
+def _content_range(response):
+    """Return the first byte position and the total length given
+    in the Content-Range header, ``None`` for the missing values.
+    """
+    match = _CONTENT_RANGE_RE.match(response.headers.get('Content-Range', ''))
+    if match is None:
+        return None, None
+    start, total = match.groups()
+    return (
+        int(start) if start is not None else None,
+        int(total) if total != '*' else None
+    )
+
+
+@attr.s(slots=True, frozen=True)
+class File:
     url: str = attr.ib(repr=False)
     content_url: str = attr.ib(repr=False)
     id: str = attr.ib()
@@ -20,26 +34,73 @@ class File(str):
     path: str = attr.ib(repr=False)
     label: str = attr.ib()
     media_type: str = attr.ib(repr=False)
+    _session: requests.Session = attr.ib(
+        default=shared_session, repr=False, eq=False, kw_only=True
+    )
 
-    def dump(self, fp):
-        response = requests.get(self.content_url)
-        response.raise_for_status()
-        if isinstance(fp, io.TextIOBase):
-            fp.write(response.text)
-        elif isinstance(fp, io.IOBase):
-            fp.write(response.content)
-        else:
-            with open(os.fspath(fp), 'wb') as f:
-                f.write(response.content)
+    def __str__(self):
+        return self.id
+
+    def dump(self, fp, resume=False):
+        """Download the file content and write it to *fp*.
+
+        *fp* can be a text or binary stream or a path. If a path is given
+        and *resume* is set, the content of an existing file is kept and
+        only the remaining part is requested from the server. The file is
+        downloaded again if the server content does not continue it.
+        """
+        if isinstance(fp, io.IOBase):
+            decode = isinstance(fp, io.TextIOBase)
+            with self._session.get(self.content_url, stream=True) as response:
+                response.raise_for_status()
+                if decode and response.encoding is None:
+                    # guessing the encoding would need the entire content
+                    response.encoding = 'utf-8'
+                chunks = response.iter_content(
+                    _CHUNK_SIZE, decode_unicode=decode
+                )
+                for chunk in chunks:
+                    fp.write(chunk)
+            return
+        path = os.fspath(fp)
+        offset = 0
+        if resume and os.path.isfile(path):
+            offset = os.path.getsize(path)
+        headers = {}
+        if offset:
+            # byte ranges refer to the encoded body, request it as is
+            headers['Range'] = f'bytes={offset}-'
+            headers['Accept-Encoding'] = 'identity'
+        response = self._session.get(
+            self.content_url, headers=headers, stream=True
+        )
+        with response:
+            if offset and response.status_code == 416:
+                if _content_range(response)[1] == offset:
+                    # nothing left to download
+                    return
+            elif (response.status_code != 206 or
+                    _content_range(response)[0] == offset):
+                response.raise_for_status()
+                mode = 'ab' if response.status_code == 206 else 'wb'
+                with open(path, mode) as f:
+                    for chunk in response.iter_content(_CHUNK_SIZE):
+                        f.write(chunk)
+                return
+        # the local file does not match the content on the server
+        self.dump(path)
 
     @staticmethod
-    def from_response(host, response):
+    def from_response(host, response, session=shared_session):
+        # positional arguments skip keyword matching in the generated
+        # __init__, which adds up for jobs with many result files
         return File(
-            url=urljoin(host, response['@url']),
-            content_url=urljoin(host, response['@content']),
-            id=response['id'],
-            job_id=response['jobId'],
-            path=response['path'],
-            label=response['label'],
-            media_type=response['mediaType']
+            join_url(host, response['@url']),
+            join_url(host, response['@content']),
+            response['id'],
+            response['jobId'],
+            response['path'],
+            response['label'],
+            response['mediaType'],
+            session=session
         )
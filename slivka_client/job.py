@@ -1,31 +1,31 @@
 from datetime import datetime, timedelta
 from typing import List
-from urllib.parse import urljoin
 
 import attr
 import requests
 
+from ._http import join_url, read_json, shared_session
 from .file import File
 
 _POLL_DELAY = timedelta(seconds=5)
 
 
-@attr.s
+@attr.s(slots=True)
 class Job:
     url: str = attr.ib()
     id: str = attr.ib()
     service: str = attr.ib()
     parameters: dict = attr.ib()
-    submission_time: datetime = attr.ib(
-        converter=lambda ds: datetime.strptime(ds, "%Y-%m-%dT%H:%M:%S")
-    )
+    submission_time: datetime = attr.ib(converter=datetime.fromisoformat)
     _completion_time: datetime = attr.ib(
-        converter=attr.converters.optional(
-            lambda ds: datetime.strptime(ds, "%Y-%m-%dT%H:%M:%S")
-        )
+        converter=attr.converters.optional(datetime.fromisoformat)
     )
     _status: str = attr.ib()
     _poll_timestamp = attr.ib(init=False, factory=datetime.now)
+    _etag: str = attr.ib(default=None, repr=False, eq=False, kw_only=True)
+    _session: requests.Session = attr.ib(
+        default=shared_session, repr=False, eq=False, kw_only=True
+    )
 
     @property
     def completion_time(self) -> datetime:
@@ -40,35 +40,45 @@ class Job:
         return self._status
 
     def get_results(self) -> List[File]:
-        response = requests.get(self.url + '/files')
+        response = self._session.get(self.url + '/files')
         response.raise_for_status()
         return [
-            File.from_response(self.url, f)
-            for f in response.json()['files']
+            File.from_response(self.url, f, self._session)
+            for f in read_json(response)['files']
         ]
 
     files = property(get_results)
     results = property(get_results)
 
     def reload(self):
-        response = requests.get(self.url)
+        headers = {}
+        if self._etag is not None:
+            headers['If-None-Match'] = self._etag
+        response = self._session.get(self.url, headers=headers)
+        if response.status_code == 304:
+            # the job has not changed since the last poll
+            self._poll_timestamp = datetime.now()
+            return
         response.raise_for_status()
-        js = response.json()
+        self._etag = response.headers.get('ETag')
+        js = read_json(response)
         if js['completionTime'] is not None:
-            self._completion_time = datetime.strptime(
-                js['completionTime'], "%Y-%m-%dT%H:%M:%S"
+            self._completion_time = datetime.fromisoformat(
+                js['completionTime']
             )
         self._status = js['status']
         self._poll_timestamp = datetime.now()
 
     @staticmethod
-    def from_response(host, response):
+    def from_response(host, response, session=shared_session, *, etag=None):
         return Job(
-            url=urljoin(host, response['@url']),
+            url=join_url(host, response['@url']),
             id=response['id'],
             service=response['service'],
             parameters=response['parameters'],
             submission_time=response['submissionTime'],
             completion_time=response.get('completionTime'),
-            status=response['status']
+            status=response['status'],
+            etag=etag,
+            session=session
         )
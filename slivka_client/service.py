@@ -1,29 +1,27 @@
 from datetime import datetime
 from typing import List, Any, Dict
-from urllib.parse import urljoin
 
 import attr
 import requests
 
+from ._http import form_request_args, join_url, read_json, shared_session
 from .job import Job
 
 
-@attr.s(frozen=True)
+@attr.s(slots=True, frozen=True)
 class Service:
-    @attr.s(frozen=True)
+    @attr.s(slots=True, frozen=True)
     class Preset:
         id: str = attr.ib()
         name: str = attr.ib()
         description: str = attr.ib()
         values: Dict[str, Any] = attr.ib()
 
-    @attr.s(frozen=False)
+    @attr.s(slots=True, frozen=False)
     class Status:
         status: str = attr.ib()
         message: str = attr.ib()
-        timestamp: datetime = attr.ib(
-            converter=lambda ds: datetime.strptime(ds, "%Y-%m-%dT%H:%M:%S")
-        )
+        timestamp: datetime = attr.ib(converter=datetime.fromisoformat)
 
     url: str = attr.ib()
     id: str = attr.ib()
@@ -36,22 +34,27 @@ class Service:
     parameters: List['_BaseParameter'] = attr.ib()
     presets: List[Preset] = attr.ib()
     status: Status = attr.ib()
+    _session: requests.Session = attr.ib(
+        default=shared_session, repr=False, eq=False, kw_only=True
+    )
 
     def submit_job(self, data=None, files=None):
-        response = requests.post(self.url + '/jobs', data=data, files=files)
+        response = self._session.post(
+            self.url + '/jobs', **form_request_args(data, files)
+        )
         if response.status_code == 422:
-            response = response.json()
+            response = read_json(response)
             raise SubmissionError([
                 ParameterValueError(e['parameter'], e['message'], e['errorCode'])
                 for e in response['errors']
             ])
         response.raise_for_status()
-        return Job.from_response(self.url, response.json())
+        return Job.from_response(self.url, read_json(response), self._session)
 
     @staticmethod
-    def from_response(host, response):
+    def from_response(host, response, session=shared_session):
         return Service(
-            url=urljoin(host, response['@url']),
+            url=join_url(host, response['@url']),
             id=response['id'],
             name=response['name'],
             description=response.get('description', ''),
@@ -60,28 +63,42 @@ class Service:
             license=response.get('license'),
             classifiers=response.get('classifiers', []),
             parameters=list(map(_create_parameter, response['parameters'])),
-            presets=[Service.Preset(**kw) for kw in response.get('presets', [])],
+            presets=[
+                Service.Preset(
+                    kw['id'], kw['name'], kw.get('description', ''),
+                    kw['values']
+                )
+                for kw in response.get('presets', ())
+            ],
             status=Service.Status(
                 status=response['status']['status'],
                 message=response['status']['errorMessage'],
                 timestamp=response['status']['timestamp']
-            )
+            ),
+            session=session
         )
 
 
 class ParameterValueError(ValueError):
     def __init__(self, parameter, message, code):
-        ValueError.__init__(self, f"Invalid value for '{parameter}': {message}")
+        ValueError.__init__(self, parameter, message, code)
         self.parameter = parameter
         self.message = message
         self.code = code
 
+    def __str__(self):
+        return f"Invalid value for '{self.parameter}': {self.message}"
+
 
 class SubmissionError(ValueError):
     def __init__(self, errors):
-        Exception.__init__(self, ', '.join(map(str, errors)))
+        ValueError.__init__(self, errors)
         self.errors = errors
 
+    def __str__(self):
+        # error messages are only formatted when the exception is printed
+        return ', '.join(map(str, self.errors))
+
 
 @attr.s(slots=True, frozen=True)
 class _BaseParameter:
@@ -169,53 +186,53 @@ class FileParameter(_BaseParameter):
     "additional annotations regarding file content"
 
 
+_PARAMETER_BUILDERS = {
+    "integer": lambda data_dict, kwargs: IntegerParameter(
+        **kwargs,
+        min=data_dict.get('min'),
+        max=data_dict.get('max')
+    ),
+    "decimal": lambda data_dict, kwargs: DecimalParameter(
+        **kwargs,
+        min=data_dict.get('min'),
+        max=data_dict.get('max'),
+        min_exclusive=data_dict.get('minExclusive', False),
+        max_exclusive=data_dict.get('maxExclusive', False)
+    ),
+    "text": lambda data_dict, kwargs: TextParameter(
+        **kwargs,
+        min_length=data_dict.get('minLength'),
+        max_length=data_dict.get('maxLength')
+    ),
+    "flag": lambda data_dict, kwargs: FlagParameter(**kwargs),
+    "choice": lambda data_dict, kwargs: ChoiceParameter(
+        **kwargs, choices=data_dict['choices']
+    ),
+    "file": lambda data_dict, kwargs: FileParameter(
+        **kwargs,
+        media_type=data_dict.get('mediaType'),
+        media_type_parameters=data_dict.get('mediaTypeParameters', {})
+    ),
+    "undefined": lambda data_dict, kwargs: UndefinedParameter(**kwargs),
+}
+
+
 def _create_parameter(data_dict):
     field_type = data_dict['type']
+    get = data_dict.get
     kwargs = {
         'id': data_dict['id'],
         'name': data_dict['name'],
-        'description': data_dict.get('description', ''),
-        'required': data_dict.get('required', True),
-        'array': data_dict.get('array', False),
-        'default': data_dict.get('default'),
+        'description': get('description', ''),
+        'required': get('required', True),
+        'array': get('array', False),
+        'default': get('default'),
     }
-    if field_type == "integer":
-        return IntegerParameter(
-            **kwargs,
-            min=data_dict.get('min'),
-            max=data_dict.get('max')
-        )
-    elif field_type == "decimal":
-        return DecimalParameter(
-            **kwargs,
-            min=data_dict.get('min'),
-            max=data_dict.get('max'),
-            min_exclusive=data_dict.get('minExclusive', False),
-            max_exclusive=data_dict.get('maxExclusive', False)
-        )
-    elif field_type == "text":
-        return TextParameter(
-            **kwargs,
-            min_length=data_dict.get('minLength'),
-            max_length=data_dict.get('maxLength')
-        )
-    elif field_type == "flag":
-        return FlagParameter(**kwargs)
-    elif field_type == "choice":
-        return ChoiceParameter(
-            **kwargs, choices=data_dict['choices']
-        )
-    elif field_type == "file":
-        return FileParameter(
-            **kwargs,
-            media_type=data_dict.get('mediaType'),
-            media_type_parameters=data_dict.get('mediaTypeParameters', {})
-        )
-    elif field_type == "undefined":
-        return UndefinedParameter(**kwargs)
-    else:
-        return CustomParameter(
-            **kwargs,
-            type=field_type,
-            attributes=data_dict
-        )
+    builder = _PARAMETER_BUILDERS.get(field_type)
+    if builder is not None:
+        return builder(data_dict, kwargs)
+    return CustomParameter(
+        **kwargs,
+        type=field_type,
+        attributes=data_dict
+    )